@@ -1,66 +1,158 @@
 import gnupg as gnu
+import io
+import logging
 import os
+import string
+import subprocess
+import time
+from multiprocessing import Pool
 
-# * create object
-gpg = gnu.GPG()
+logger = logging.getLogger(__name__)
+
+# * payloads that gain nothing from gpg compression or ascii armor
+COMPRESSED_SUFFIXES = (".gz", ".zip", ".jpg", ".png", ".mp4")
+
+# * gpg object is created on first use, GPG() spawns gpg to probe its version
+_gpg = None
+
+# * keyring listings per check_private flag, as (timestamp, keys). cleared when keys are added
+_KEY_CACHE: dict[bool, tuple[float, list]] = {}
+KEY_CACHE_TTL = 30
 
 def _get_success_icon(success: bool) -> str:
     return "✅" if success else "❌"
 
+def _get_gpg() -> gnu.GPG:
+    global _gpg
+    if _gpg is None:
+        _gpg = gnu.GPG()
+    return _gpg
+
+def __getattr__(name: str):
+    # * keep `pgp.gpg` available without creating it at import
+    if name == "gpg":
+        return _get_gpg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _list_keys(check_private: bool = False) -> list:
+    # * reuse a recent listing instead of letting gpg parse the whole keyring again
+    cached = _KEY_CACHE.get(check_private)
+    if cached and time.monotonic() - cached[0] < KEY_CACHE_TTL:
+        return cached[1]
+    keys = _get_gpg().list_keys(check_private)
+    _KEY_CACHE[check_private] = (time.monotonic(), keys)
+    return keys
+
+def _find_key_hinted(key_id: str, check_private: bool = False) -> tuple[list, list]:
+    # * let gpg select the key by id/fingerprint and scan its colon output, skips parsing the full keyring
+    # * only hex ids of 8/16/40 chars are exact key specs for gpg, other input would be taken as user id
+    if len(key_id) not in (8, 16, 40) or not all(c in string.hexdigits for c in key_id):
+        return [], []
+
+    gpg = _get_gpg()
+    cmd = [gpg.gpgbinary, "--batch", "--with-colons", "--fingerprint"]
+    if gpg.gnupghome:
+        cmd += ["--homedir", gpg.gnupghome]
+    cmd += ["--list-secret-keys" if check_private else "--list-keys", key_id]
+    out = subprocess.run(cmd, capture_output=True, text=True).stdout
+
+    # * gpg prints ids and fingerprints in upper case
+    key_id = key_id.upper()
+    key_ids_match = []
+    key_prints_match = []
+    keyid = None
+    for line in out.splitlines():
+        fields = line.split(":")
+        if fields[0] in ("pub", "sec"):
+            keyid = fields[4]
+        elif fields[0] == "fpr" and keyid:
+            # * first fpr after pub/sec belongs to the primary key
+            if key_id in keyid:
+                key_ids_match.append(keyid)
+            elif key_id in fields[9]:
+                key_prints_match.append(fields[9])
+            keyid = None
+        elif fields[0] in ("sub", "ssb"):
+            keyid = None
+    return key_ids_match, key_prints_match
+
+def _as_stream(message: str | bytes) -> io.BytesIO:
+    # * hand gpg a file object so it reads the buffer directly instead of via gpg.encrypt/decrypt
+    if isinstance(message, str):
+        message = message.encode(_get_gpg().encoding)
+    return io.BytesIO(message)
+
 def generate_key(
     name_email: str = "test@example.com",
     key_length: int = 2048,
     name_real: str = "slim shady",
     name_comment: str = "this is a test key",
-    key_type: str = "RSA",
+    key_type: str = "EDDSA",
     passphrase: str = None,
+    key_curve: str = "ed25519",
 ) -> object:
     """
     Generate a PGP key with the given parameters.
 
     Args:
         name_email (str): The email address associated with the key. Defaults to "test@example.com".
-        key_length (int): The length of the key in bits. Defaults to 2048.
+        key_length (int): The length of the key in bits, used for all key types except EDDSA. Defaults to 2048.
         name_real (str): The real name associated with the key. Defaults to "slim shady".
         name_comment (str): A comment associated with the key. Defaults to "this is a test key".
-        key_type (str): The type of key to generate. Defaults to "RSA".
+        key_type (str): The type of key to generate. Defaults to "EDDSA", use "RSA" for legacy compatibility.
         passphrase (str): The passphrase to protect the key. Defaults to PASSPHRASE_TEST.
+        key_curve (str): The curve for EDDSA keys, an ECDH cv25519 subkey is added for encryption. Defaults to "ed25519".
 
     Returns:
         object: The generated PGP key object.
     """
+    # * curve keys are generated in milliseconds, rsa keygen may block for seconds
+    # * only eddsa takes a curve, every other key type keeps the key length
+    if key_type.upper() == "EDDSA":
+        key_params = {
+            "key_curve": key_curve,
+            "subkey_type": "ECDH",
+            "subkey_curve": "cv25519",
+        }
+    else:
+        key_params = {"key_length": key_length}
+
     # * setup config
-    input_data = gpg.gen_key_input(
+    input_data = _get_gpg().gen_key_input(
         name_email=name_email,
-        key_length=key_length,
         name_real=name_real,
         name_comment=name_comment,
         key_type=key_type,
         passphrase=passphrase,
+        **key_params,
     )
 
     # * generate raw key object
-    key = gpg.gen_key(input_data)
+    key = _get_gpg().gen_key(input_data)
+    _KEY_CACHE.clear()
 
     return key
 
 
-def export_public_key(key: object, output_file_path: str = None) -> str:
+def export_public_key(key: object, output_file_path: str = None, verbose: bool = False) -> str:
     """
     A function to export a public key from an object id.
 
     Parameters:
         key (object): The object id from which the public key will be exported.
         output_file_path (str, optional): The file path where the public key will be saved. Defaults to None.
+        verbose (bool, optional): Whether to print the public key as copyable text. Defaults to False.
 
     Returns:
         str: The exported public key.
     """
     # * export public key from object id
-    public_key = gpg.export_keys(key.__str__(), secret=False)
+    fp = str(key)
+    public_key = _get_gpg().export_keys(fp, secret=False)
 
     # * print public key to have copyable text
-    print(public_key)
+    if verbose:
+        print(public_key)
 
     if output_file_path:
         with open(output_file_path, "w") as f:
@@ -84,18 +176,20 @@ def export_private_key(
         str: The exported private key.
 
     """
-    private_key = gpg.export_keys(key.__str__(), secret=True, passphrase=passphrase)
+    fp = str(key)
+    private_key = _get_gpg().export_keys(fp, secret=True, passphrase=passphrase)
 
     return private_key
 
 
-def import_key(key: str, key_file_path: str = None) -> object:
+def import_key(key: str, key_file_path: str = None, verbose: bool = False) -> object:
     """
     A function that imports a PGP key either from a string or a file path and returns the import results. Either public or private key can be imported.
 
     Parameters:
     key (str): The PGP key to import, either passed as a string or read from a file.
     key_file_path (str, optional): The file path to the PGP key file. If provided, the function reads the key from this file.
+    verbose (bool, optional): Whether to print the import results. Defaults to False.
 
     Returns:
     object: The import results of the PGP key.
@@ -105,27 +199,35 @@ def import_key(key: str, key_file_path: str = None) -> object:
         with open(key_file_path, "r") as f:
             key = f.read()
 
-    result = gpg.import_keys(key)
-    print(result.results)
+    result = _get_gpg().import_keys(key)
+    _KEY_CACHE.clear()
+    if verbose:
+        print(result.results)
     return result.results
 
 
 def encrypt(
     recipient_key_id_list: str | list[str],
-    message: str = None,
+    message: str | bytes = None,
     message_file_path: str = None,
+    armor: bool | None = True,
+    compress: bool = None,
+    binary: bool = False,
 ) -> any:
     """
     Encrypts a message using PGP encryption for the specified recipient key IDs and optional passphrase.
 
     Args:
-        message (str): The message to be encrypted.
+        message (str | bytes): The message to be encrypted.
         recipient_key_id_list (str | list[str]): The recipient key ID(s) for encryption.
         passphrase (str, optional): The passphrase for encryption. Defaults to PASSPHRASE_TEST.
         output_file_path (str, optional): The file path to save the encrypted message. Defaults to None.
+        armor (bool | None, optional): Whether to produce ascii armored output. None skips armor for already compressed files (.gz, .zip, .jpg, .png, .mp4). Defaults to True.
+        compress (bool, optional): Whether gpg compresses the payload. Defaults to None (off for already compressed files, else on).
+        binary (bool, optional): Whether to skip armor and return the raw ciphertext bytes of a message instead of the result. Defaults to False.
 
     Returns:
-        result: Result of the encryption.
+        result: Result of the encryption, or the ciphertext bytes if binary is set for a message.
     """
     if not message and not message_file_path:
         print("❌ no message or message file to encrypt")
@@ -135,41 +237,58 @@ def encrypt(
     if not isinstance(recipient_key_id_list, list):
         recipient_key_id_list = [recipient_key_id_list]
 
-    if message_file_path:
-        result = gpg.encrypt_file(
-            message_file_path,
-            recipients=recipient_key_id_list,
-            output=message_file_path+".gpg",
-            always_trust=True,  # ! if false, keys trust must be ultimate
-        )
-    else:
-        result = gpg.encrypt(
-            data=message,
-            recipients=recipient_key_id_list,
-            always_trust=True,  # ! if false, keys trust must be ultimate
-        )
+    # * already compressed payloads skip gpg compression. armor is only skipped for them with armor=None,
+    # * so the default output format stays ascii armored
+    is_compressed = bool(message_file_path) and message_file_path.lower().endswith(COMPRESSED_SUFFIXES)
+    if binary:
+        armor = False
+    elif armor is None:
+        armor = not is_compressed
+    if compress is None:
+        compress = not is_compressed
+
+    # * files are read by gpg via path, buffers are streamed without an extra copy
+    result = _get_gpg().encrypt_file(
+        message_file_path if message_file_path else _as_stream(message),
+        recipients=recipient_key_id_list,
+        output=message_file_path+".gpg" if message_file_path else None,
+        always_trust=True,  # ! if false, keys trust must be ultimate
+        armor=armor,
+        extra_args=None if compress else ["--compress-algo", "none"],
+    )
+
+    # * lazy %-formatting, the message is only built if a handler emits it. failures stay visible by default
+    logger.log(
+        logging.INFO if result.ok else logging.WARNING,
+        "%s encrypted message for recipient(s) %s",
+        _get_success_icon(result.ok),
+        recipient_key_id_list,
+    )
 
-    # out = result.data.decode("utf-8")
-    print(f"{_get_success_icon(result.ok)} encrypted message for recipient(s) {recipient_key_id_list}")
+    # * programmatic use: hand back ciphertext bytes, no armor and no decoding
+    if binary and not message_file_path:
+        return result.data if result.ok else None
     return result
 
 
 def decrypt(
-    message: str = None,
+    message: str | bytes = None,
     message_file_path: str = None,
     passphrase: str = None,
+    binary: bool = False,
 ) -> any:
     """
     A function to decrypt a PGP message. Decrypts the provided message using a passphrase and returns the decrypted message as a string.
     Private key of recipient must be in keyring!
 
     Parameters:
-    - message: str, the PGP message to decrypt
+    - message: str | bytes, the PGP message to decrypt
     - message_file_path: str, optional, the file path to the PGP message to decrypt
     - passphrase: str, the passphrase required for decryption
+    - binary: bool, optional, whether to return the plaintext bytes of a message instead of the result
 
     Returns:
-    - result: the result of the decryption
+    - result: the result of the decryption, or the plaintext bytes if binary is set for a message
 
     hint: result.data.decode("utf-8")
     """
@@ -177,29 +296,102 @@ def decrypt(
     if not message and not message_file_path:
         print("❌ no message or message file to decrypt")
         return None
-    if message_file_path:
-        # with open(message_file_path) as f:
-        #     message = f.read()
-        result = gpg.decrypt_file(
-            fileobj_or_path=message_file_path,
-            passphrase=passphrase,
-            output=message_file_path[:-4],
-            always_trust=True,
-        )
-    else:
-        # * decrypt using secret key
-        result = gpg.decrypt(
-            message,
-            passphrase=passphrase,
-            always_trust=True,
-        )
+    # * decrypt using secret key, files are read by gpg via path
+    result = _get_gpg().decrypt_file(
+        fileobj_or_path=message_file_path if message_file_path else _as_stream(message),
+        passphrase=passphrase,
+        output=message_file_path[:-4] if message_file_path else None,
+        always_trust=True,
+    )
 
-    # * decode byte stream to string
-    print(f"{_get_success_icon(result.ok)} decrypted message")
-    
+    logger.log(
+        logging.INFO if result.ok else logging.WARNING,
+        "%s decrypted message",
+        _get_success_icon(result.ok),
+    )
+
+    # * programmatic use: hand back plaintext bytes without decoding
+    if binary and not message_file_path:
+        return result.data if result.ok else None
     return result
 
 
+def _encrypt_file_worker(args: tuple) -> bool:
+    path, recipient_key_id_list = args
+    # * a failing file must not raise, pool.map would drop the results of the whole batch
+    try:
+        result = encrypt(recipient_key_id_list, message_file_path=path)
+    except Exception as e:
+        logger.warning("%s encrypting %s failed: %s", _get_success_icon(False), path, e)
+        return False
+    return result is not None and result.ok
+
+
+def _decrypt_file_worker(args: tuple) -> bool:
+    path, passphrase = args
+    try:
+        result = decrypt(message_file_path=path, passphrase=passphrase)
+    except Exception as e:
+        logger.warning("%s decrypting %s failed: %s", _get_success_icon(False), path, e)
+        return False
+    return result is not None and result.ok
+
+
+def encrypt_many(
+    list_file_paths: list[str],
+    recipient_key_id_list: str | list[str],
+    workers: int = None,
+) -> list[bool]:
+    """
+    Encrypts a list of files in parallel, each into a sibling .gpg file. One gpg process runs per worker.
+
+    Args:
+        list_file_paths (list[str]): The file paths to encrypt.
+        recipient_key_id_list (str | list[str]): The recipient key ID(s) for encryption.
+        workers (int, optional): The number of worker processes. Defaults to None (cpu count, capped by number of files).
+
+    Returns:
+        list[bool]: Success of the encryption per file, in order of list_file_paths.
+    """
+    if not list_file_paths:
+        return []
+    workers = min(workers or os.cpu_count(), len(list_file_paths))
+
+    with Pool(workers) as pool:
+        return pool.map(
+            _encrypt_file_worker,
+            [(path, recipient_key_id_list) for path in list_file_paths],
+        )
+
+
+def decrypt_many(
+    list_file_paths: list[str],
+    passphrase: str = None,
+    workers: int = None,
+) -> list[bool]:
+    """
+    Decrypts a list of .gpg files in parallel, each next to its source with the .gpg suffix stripped.
+    Private key of recipient must be in keyring!
+
+    Args:
+        list_file_paths (list[str]): The file paths to decrypt.
+        passphrase (str, optional): The passphrase required for decryption. Defaults to None.
+        workers (int, optional): The number of worker processes. Defaults to None (cpu count, capped by number of files).
+
+    Returns:
+        list[bool]: Success of the decryption per file, in order of list_file_paths.
+    """
+    if not list_file_paths:
+        return []
+    workers = min(workers or os.cpu_count(), len(list_file_paths))
+
+    with Pool(workers) as pool:
+        return pool.map(
+            _decrypt_file_worker,
+            [(path, passphrase) for path in list_file_paths],
+        )
+
+
 def find_key(key_id: str, check_private: bool = False) -> str:
     """
     Finds a PGP key by its key ID. Either key id or fingerprint must be provided.
@@ -218,12 +410,24 @@ def find_key(key_id: str, check_private: bool = False) -> str:
         print("❌ key_id must be at least 6 characters long")
         return None
 
-    keys = gpg.list_keys(check_private)
-    key_ids = [key["keyid"] for key in keys]
-    key_prints = [key["fingerprint"] for key in keys]
-
-    key_ids_match = [item for item in key_ids if key_id in item]
-    key_prints_match = [item for item in key_prints if key_id in item]
+    key_ids_match, key_prints_match = [], []
+
+    # * a fresh cached listing answers without spawning gpg. only a cold cache asks gpg directly
+    cached = _KEY_CACHE.get(check_private)
+    is_cache_fresh = bool(cached) and time.monotonic() - cached[0] < KEY_CACHE_TTL
+    if not is_cache_fresh:
+        key_ids_match, key_prints_match = _find_key_hinted(key_id, check_private)
+
+    # * single pass over the (cached) keyring, checking id and fingerprint of each key.
+    # * a full fingerprint can only match as a whole, so a miss of gpg's direct lookup is final there
+    is_lookup_final = not is_cache_fresh and len(key_id) == 40
+    if not key_ids_match and not key_prints_match and not is_lookup_final:
+        needle = key_id.upper()
+        for key in _list_keys(check_private):
+            if needle in key["keyid"]:
+                key_ids_match.append(key["keyid"])
+            elif needle in key["fingerprint"]:
+                key_prints_match.append(key["fingerprint"])
 
     if key_ids_match:
         print(f"✅ key found: {key_ids_match}")
@@ -1,13 +1,158 @@
 import os
+import queue
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from typing import Literal
-import pandas as pd
+from uuid import UUID
 import duckdb as ddb
 from pathlib import Path
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL
 from sqlalchemy_utils import create_database, database_exists
 
+# * python value type -> sqlite column type, everything else is stored as TEXT
+_SQLITE_TYPES = {
+    bool: "INTEGER",
+    int: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    bytes: "BLOB",
+    datetime: "TIMESTAMP",
+    date: "DATE",
+    time: "TIME",
+    timedelta: "INTEGER",
+    Decimal: "REAL",
+    UUID: "TEXT",
+}
+
+# * sqlite3 only binds None/int/float/str/bytes natively. source drivers also hand out these types,
+# * stored the way pandas to_sql did: iso strings, timedelta as nanoseconds, decimal as float.
+# * values are converted per load, nothing is registered with sqlite3, so other sqlite3 code is unaffected
+_SQLITE_NATIVE = (type(None), int, float, str, bytes, bytearray, memoryview)
+_SQLITE_CONVERTERS = {
+    datetime: lambda v: v.isoformat(" "),
+    date: lambda v: v.isoformat(),
+    time: lambda v: f"{v.hour:02d}:{v.minute:02d}:{v.second:02d}.{v.microsecond:06d}",
+    timedelta: lambda v: v // timedelta(microseconds=1) * 1000,
+    Decimal: float,
+    UUID: str,
+}
+_PENDING = object()
+
+
+def _sqlite_converter(value) -> object:
+    # * None for values sqlite3 binds as they are, unknown types are stored as text instead of failing the load
+    if isinstance(value, _SQLITE_NATIVE):
+        return None
+    # * dict order matters, datetime is a subclass of date
+    return next((f for t, f in _SQLITE_CONVERTERS.items() if isinstance(value, t)), str)
+
+
+def _convert_rows(batch: list, converters: list) -> list[tuple]:
+    # * a db column hands out a single python type, so the converter is resolved once per column.
+    # * columns that were only null so far stay _PENDING until a batch has a value
+    for i, f in enumerate(converters):
+        if f is _PENDING:
+            value = next((row[i] for row in batch if row[i] is not None), None)
+            if value is not None:
+                converters[i] = _sqlite_converter(value)
+    active = [None if f is _PENDING else f for f in converters]
+    if not any(active):
+        return [tuple(row) for row in batch]
+    return [tuple(v if v is None or f is None else f(v) for v, f in zip(row, active)) for row in batch]
+
+
+def _build_url(dbms: str, db: str, host: str, user: str, pw: str) -> URL | None:
+    # * URL.create escapes credentials itself, so characters like @ : / or spaces in user or password are kept as they are
+    # * an optional :port on the host is split off, URL.create takes it separately
+    host, _, port = host.partition(":") if host.rpartition(":")[2].isdigit() else (host, "", "")
+    port = int(port) if port else None
+    if dbms == "mssql":
+        return URL.create(
+            "mssql", username=user, password=pw, host=host, port=port, database=db,
+            query={"driver": "ODBC Driver 17 for SQL Server"},
+        )
+    elif dbms == "sqlite":
+        return URL.create("sqlite", database=db)
+    elif dbms == "postgres":
+        return URL.create(
+            "postgresql+psycopg2", username=user, password=pw, host=host, port=port, database=db,
+        )
+    return None
+
+
+def _prefetch(iterable, maxsize: int = 2):
+    # * producer thread fills a bounded queue, so fetching the next batch overlaps writing the current one
+    q = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # * give up once the consumer is gone, instead of blocking on a full queue forever
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+            _put((None, None))
+        except Exception as e:
+            _put((None, e))
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = q.get()
+            if error is not None:
+                raise error
+            if item is None:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _split_tables(list_tables: list) -> list[tuple[str, str]]:
+    # * items are either all names or all [name, friendly name] pairs. friendly name defaults to the name without schema
+    is_list_nested = all(isinstance(i, (list, tuple)) for i in list_tables)
+    pairs = []
+    for item in list_tables:
+        table_sql, table_friendly = (item[0], item[1]) if is_list_nested else (item, None)
+        pairs.append((table_sql, table_friendly or (table_sql.split(".")[1] if "." in table_sql else table_sql)))
+    return pairs
+
+
+@lru_cache(maxsize=16)
+def _get_engine(url: URL) -> object:
+    # * one pooled engine per server url, so repeated connects reuse open connections
+    # * pyodbc sends executemany batches in one bulk call instead of row by row
+    dialect_args = {"fast_executemany": True} if url.drivername.startswith("mssql") else {}
+    return create_engine(
+        url,  # * leave positional argument unnamed, since it was relabeled between versions..
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        connect_args={"connect_timeout": 10},
+        **dialect_args,
+    )
+
 
 def connect_sql(
     db: str,
@@ -29,7 +174,7 @@ def connect_sql(
         ensure_db_exists (bool, optional): Specifies whether to create the database if it does not exist. Defaults to False.
 
     Returns:
-        Connection: The context object for the established database connection
+        Connection: The context object for the established database connection. Call `con.close()` to hand it back to the pool.
 
     Remarks:
         - postgres
@@ -43,23 +188,28 @@ def connect_sql(
                     dbms='postgres',
                     ensure_db_exists=False
                 )
+        - pooling
+            - engines for mssql and postgres are cached per url, so repeated calls share one pool
+            - the pool is safe to use across threads, but not across processes. connections inherited
+              through a fork must not be used by the child: call `con.engine.dispose(close=False)`
+              in the child first. it swaps in a fresh pool without closing the parent's connections,
+              and later `connect_sql()` calls in the child get the same (now clean) engine
 
     """
 
-    if dbms == "mssql":
-        url = f"mssql://{user}:{pw}@{host}/{db}?driver=ODBC Driver 17 for SQL Server"
-    elif dbms == "sqlite":
-        url = f"sqlite:///{db}"
-    elif dbms == "postgres":
-        url = f"postgresql+psycopg2://{user}:{pw}@{host}/{db}"
-    else:
+    url = _build_url(dbms, db, host, user, pw)
+    if url is None:
         print("dbms not supported")
         return None
 
-    engine = create_engine(
-        url,  # * leave positional argument unnamed, since it was relabeled between versions..
-        connect_args={"connect_timeout": 10},
-    )
+    # * sqlite is file scoped and gains nothing from a shared pool
+    if dbms == "sqlite":
+        engine = create_engine(
+            url,  # * leave positional argument unnamed, since it was relabeled between versions..
+            connect_args={"connect_timeout": 10},
+        )
+    else:
+        engine = _get_engine(url)
 
     # * ensure db exists
     if ensure_db_exists:
@@ -85,7 +235,10 @@ def load_sql_to_sqlite(
     list_tables: list[str],
     dict_meta: dict = None,
     top_n_rows: int=0,
-    verbose: bool=True
+    verbose: bool=True,
+    vacuum: bool=False,
+    dict_columns: dict[str, list[str]] = None,
+    batchsize: int | None = None,
 ) -> None:
     """
     Load SQL tables into a SQLite database.
@@ -97,6 +250,9 @@ def load_sql_to_sqlite(
         dict_meta (dict, optional): A dictionary containing metadata to be written to the SQLite database. Defaults to None.
         top_n_rows (int, optional): The number of rows to load from each table. Defaults to 0.
         verbose (bool, optional): Whether to print progress messages. Defaults to True.
+        vacuum (bool, optional): Whether to compact the SQLite file after all tables are loaded. Defaults to False.
+        dict_columns (dict[str, list[str]], optional): Columns to load per source table, keyed by the source table name. Tables not listed load all columns. Defaults to None.
+        batchsize (int | None, optional): Rows fetched per round trip. Defaults to None, which derives it per table from the column count (1,000 to 200,000 rows).
 
     Returns:
         None
@@ -105,55 +261,88 @@ def load_sql_to_sqlite(
         None
 
     Description:
-        This function loads SQL tables from a source database into a SQLite database. If the SQLite database file already exists, the function exits. The function writes metadata to the SQLite database if a dictionary is provided. The function loads tables in batches of 10,000 rows and appends the loaded data to the corresponding table in the SQLite database.
+        This function loads SQL tables from a source database into a SQLite database. If the SQLite database file already exists, the function exits. The function writes metadata to the SQLite database if a dictionary is provided. The function loads tables in batches and appends the loaded data to the corresponding table in the SQLite database.
     """
     # * check if db already exists
     if os.path.exists(file_db):
         print(f"❌ {file_db} already exists. exiting..")
         return
 
-    con_sqlite = sqlite3.connect(file_db)
-    batchsize = 10000
-
-    # todo normalize on a set of terms like table_created_at, data_extracted_at, etc.
-    # (table_created_at, data_extracted_at, (table_transmitted_at))
-    # {"table_created_at":"lol", "data_extracted_at":"xde"}
-    # * write meta table if dict was given
-    if dict_meta is not None:
-        df_meta = pd.DataFrame.from_dict(dict_meta, orient="index").T
-        df_meta.to_sql("_meta", con_sqlite, if_exists="replace", index=False)
-    
-    is_list_nested=all([isinstance(i,list) for i in list_tables])
-
-    for item in list_tables:
-        if is_list_nested:
-            table_sql = item[0]
-            table_friendly = item[1] if item[1] else item[0] if "." not in item[0] else item[0].split(".")[1]
-        else:
-            table_sql = item
-            table_friendly = item if "." not in item else item.split(".")[1]
-            
-        if verbose:
-            print(f"processing: {table_sql} -> {table_friendly}")
-
-        top= f" top {top_n_rows}" if top_n_rows else ""
-        qry = f"select{top} * from {table_sql}"
+    # * no implicit transactions, every table is loaded in one explicit BEGIN .. COMMIT
+    con_sqlite = sqlite3.connect(file_db, isolation_level=None)
 
-        proxy = (con_source
-                .execution_options(stream_results=True)
-                .execute(text(qry))
+    # * exclusive lock is held until close, so the file is released even if a table fails
+    try:
+        # * file is created from scratch, so trade durability for bulk insert speed
+        con_sqlite.execute("PRAGMA page_size=32768")  # * larger pages for bulk tables, only applies before the first write
+        con_sqlite.execute("PRAGMA synchronous=OFF")
+        con_sqlite.execute("PRAGMA journal_mode=MEMORY")
+        con_sqlite.execute("PRAGMA temp_store=MEMORY")
+        con_sqlite.execute("PRAGMA cache_size=-262144")  # * 256 MB page cache
+        con_sqlite.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+        # todo normalize on a set of terms like table_created_at, data_extracted_at, etc.
+        # (table_created_at, data_extracted_at, (table_transmitted_at))
+        # {"table_created_at":"lol", "data_extracted_at":"xde"}
+        # * write meta table if dict was given
+        # * single row, so plain sqlite is enough. column types follow the python values
+        if dict_meta is not None:
+            cols_meta = ", ".join(f'"{k}" {_SQLITE_TYPES.get(type(v), "TEXT")}' for k, v in dict_meta.items())
+            with con_sqlite:
+                con_sqlite.execute("BEGIN")
+                con_sqlite.execute(f"create table _meta ({cols_meta})")
+                con_sqlite.execute(
+                    f"insert into _meta values ({', '.join('?' * len(dict_meta))})",
+                    # * native types are bound as they are, everything else is converted like table values
+                    [v if (f := _sqlite_converter(v)) is None else f(v) for v in dict_meta.values()],
                 )
-        cols = list(proxy.keys())
-
-        # todo pandas -> duckdb ??
-        while 'batch not empty':
-            batch = proxy.fetchmany(batchsize)
-            df = pd.DataFrame(batch, columns=cols)
-            df.to_sql(table_friendly, con_sqlite, if_exists="append", index=False)
-            if not batch:
-                break
-        
-    con_sqlite.close()
+    
+        for table_sql, table_friendly in _split_tables(list_tables):
+            if verbose:
+                print(f"processing: {table_sql} -> {table_friendly}")
+
+            top= f" top {top_n_rows}" if top_n_rows else ""
+            # * only pull requested columns over the wire
+            cols_select = ", ".join(dict_columns[table_sql]) if dict_columns and table_sql in dict_columns else "*"
+            qry = f"select{top} {cols_select} from {table_sql}"
+
+            # * server side cursor that buffers a full batch per round trip
+            proxy = con_source.execution_options(stream_results=True).execute(text(qry))
+            cols = list(proxy.keys())
+
+            # * narrow tables get bigger batches, wide tables smaller ones, so a batch stays at ~2 mio values
+            size = batchsize or max(1000, min(200_000, 2_000_000 // max(len(cols), 1)))
+            proxy = proxy.yield_per(size)
+            proxy.cursor.arraysize = size
+
+            # * iterator stops at the first empty batch, nothing empty gets written
+            # * source is read in a background thread while sqlite writes, at most 2 batches wait in memory
+            with closing(_prefetch(iter(lambda: proxy.fetchmany(size), []))) as batches:
+                first = next(batches, [])
+
+                # * create table once, column types follow the first non-null value of the first batch
+                types = [
+                    _SQLITE_TYPES.get(type(next((row[i] for row in first if row[i] is not None), None)), "TEXT")
+                    for i in range(len(cols))
+                ]
+                cols_ddl = ", ".join(f'"{c}" {t}' for c, t in zip(cols, types))
+
+                # * insert raw rows with one prepared statement, table and all batches in one transaction
+                qry_insert = f'insert into "{table_friendly}" values ({", ".join("?" * len(cols))})'
+                with con_sqlite:
+                    con_sqlite.execute("BEGIN")
+                    con_sqlite.execute(f'create table if not exists "{table_friendly}" ({cols_ddl})')
+                    converters = [_PENDING] * len(cols)
+                    for batch in chain([first], batches):
+                        con_sqlite.executemany(qry_insert, _convert_rows(batch, converters))
+
+        # * rebuild the file once at the end, pages of all tables end up contiguous
+        if vacuum:
+            if verbose:
+                print("⏳ vacuuming")
+            con_sqlite.execute("VACUUM")
+    finally:
+        con_sqlite.close()
     return
 
 def load_sqlite_to_parquet(
@@ -164,6 +353,13 @@ def load_sqlite_to_parquet(
     overwrite: bool = False,
     verbose: bool = True,
     debug: bool = False,
+    dict_partition_by: dict[str, list[str]] = None,
+    per_thread_output: bool = False,
+    file_size_bytes: str = None,
+    writer_threads: int = None,
+    max_workers: int = None,
+    table_where: str = "",
+    top_n_rows: int = 0,
 ) -> None:
     """
     Saves tables of a SQLite database file into individual Parquet files for each table.
@@ -177,6 +373,13 @@ def load_sqlite_to_parquet(
         overwrite (bool, optional): Whether to overwrite existing files. Defaults to False.
         verbose (bool, optional): Whether to print the progress. Defaults to True.
         debug (bool, optional): Whether to debug. Defaults to False.
+        dict_partition_by (dict[str, list[str]], optional): Partition columns per table. Listed tables are written as hive partitioned directories `<table>/<col>=<value>/` instead of a single file. Defaults to None.
+        per_thread_output (bool, optional): Whether every duckdb thread writes its own file. Tables are written as directories `<table>/` then. Defaults to False.
+        file_size_bytes (str, optional): Roll over to a new file once this size is reached, e.g. "512MB". Tables are written as directories `<table>/` then. Defaults to None.
+        writer_threads (int, optional): Number of duckdb threads. Defaults to None, which means at most 4 threads, or all cores if per_thread_output is set.
+        max_workers (int, optional): Number of tables exported at the same time. Defaults to None, which means one per core.
+        table_where (str, optional): The optional sql condition on duckdb_tables() to select tables, evaluated inside duckdb without pandas. Defaults to "". Example: "table_name like 'dim%'"
+        top_n_rows (int, optional): The number of rows to export from each table. Defaults to 0, which means all rows.
 
     Returns:
         None
@@ -185,29 +388,46 @@ def load_sqlite_to_parquet(
     if not os.path.exists(dir_local):
         os.makedirs(dir_local)
 
+    # * list the output dir once, instead of one stat call per table
+    existing = set(os.listdir(dir_local))
+
     # todo add support for views
     # views = ",'view'" if fetch_views else ""
 
     # * retrieve db name from file, this will be default name 
     db_name= os.path.basename(file_sqlite).split(".")[0]
 
-    # * connect to db 
-    con= ddb.connect(file_sqlite)
+    # * connect to db. read only, the export never writes and needs no write lock on the file
+    con= ddb.connect(file_sqlite, read_only=True)
 
-    # * retrieve all tables. this cant be filtered by database_name (weird effect)
-    df_db=con.sql("SELECT * FROM duckdb_tables();").to_df()
+    # * too many threads writing into one parquet file mostly wait on the file lock.
+    # * per thread output has no shared file, so all cores can be used there
+    if writer_threads is None:
+        writer_threads = os.cpu_count() if per_thread_output else min(4, os.cpu_count())
+    con.execute(f"SET threads={int(writer_threads)}")
+    # * row order of a table export is irrelevant, this lets all threads encode row groups in parallel
+    con.execute("SET preserve_insertion_order=false")
 
-    # * narrow down tables
-    df_tbl = df_db.query(table_filter) if table_filter else df_db
+    # * retrieve all tables. this cant be filtered by database_name (weird effect)
+    # * sql condition is pushed into duckdb, only go through pandas if a pandas filter query was given
+    where = f" WHERE {table_where}" if table_where else ""
+    if table_filter:
+        tables = con.sql(f"SELECT * FROM duckdb_tables(){where};").to_df().query(table_filter)["table_name"].tolist()
+    else:
+        tables = [row[0] for row in con.execute(f"SELECT table_name FROM duckdb_tables(){where};").fetchall()]
 
     if debug:
         print("🧪 debugging 🧪")
-        # display(df_tbl)
+        # display(tables)
 
-    # * write tables in a loop
-    for tbl in df_tbl["table_name"]:
-        path = os.path.join(dir_local, f"{tbl}.parquet")
-        exists = os.path.exists(path)
+    # * collect copy statements first, tables are exported in parallel afterwards
+    qrys = []
+    for tbl in tables:
+        partition_by = dict_partition_by.get(tbl) if dict_partition_by else None
+        # * these options write several files, so the target is a directory instead of a file
+        is_dir = bool(partition_by) or per_thread_output or file_size_bytes is not None
+        path = os.path.join(dir_local, tbl if is_dir else f"{tbl}.parquet")
+        exists = os.path.basename(path) in existing
 
         if verbose or debug:
             if exists:
@@ -219,9 +439,96 @@ def load_sqlite_to_parquet(
                 print(f"⏳ creating: {path}")
 
         if not debug and ((overwrite and exists) or (not exists)):
-            # todo add top_n_rows
-            qry=f"copy (select * from {tbl}) to '{path}'"
-            con.sql(qry)
+            # * zstd row groups keep files small and allow row group skipping on read
+            options = "format parquet, compression zstd, row_group_size 122880"
+            if partition_by:
+                options += f", partition_by ({', '.join(partition_by)})"
+            # * large tables: split output, so writer threads dont serialize on a single file
+            if per_thread_output:
+                options += ", per_thread_output true"
+            if file_size_bytes is not None:
+                options += f", file_size_bytes '{file_size_bytes}'"
+            # * a rerun replaces the whole output directory, else partitions or data_N files of the old run would stay behind
+            if is_dir and exists:
+                options += ", overwrite true"
+            elif is_dir:
+                options += ", overwrite_or_ignore"
+            # * limit is part of the scan, so only the sampled rows are read and encoded
+            limit = f" limit {top_n_rows}" if top_n_rows else ""
+            qrys.append(f"copy (select * from {tbl}{limit}) to '{path}' ({options})")
+
+    # * one cursor per thread, duckdb connections must not be shared across threads
+    def _copy(qry: str) -> None:
+        cur = con.cursor()
+        cur.execute(qry)
+        cur.close()
+
+    if qrys:
+        with ThreadPoolExecutor(max_workers=min(max_workers or os.cpu_count(), len(qrys))) as pool:
+            list(pool.map(_copy, qrys))
+
+    con.close()
+    return
+
+
+def load_sql_to_parquet(
+    source: str,
+    list_tables: list[str],
+    dir_local: str,
+    dbms: Literal["postgres", "mysql", "sqlite"] = "postgres",
+    top_n_rows: int = 0,
+    overwrite: bool = False,
+    verbose: bool = True,
+) -> None:
+    """
+    Exports SQL tables directly into individual Parquet files, without staging them in a sqlite file.
+    This method uses duckdb engine, the source is attached via the duckdb scanner extension of the given dbms.
+
+    Args:
+        source (str): The connection string of the source, e.g. "postgresql://user:pw@host:5432/db", "host=... dbname=... user=..." or the path of a sqlite file.
+        list_tables (list[str]): A list of SQL tables to export. Each table can be specified as a string or a list of two strings, where the first string is the table name in the source database and the second string is the name of the Parquet file (optional).
+        dir_local (str): The directory where the Parquet files will be saved.
+        dbms (Literal['postgres', 'mysql', 'sqlite'], optional): The type of the source. Defaults to 'postgres'.
+        top_n_rows (int, optional): The number of rows to export from each table. Defaults to 0, which means all rows.
+        overwrite (bool, optional): Whether to overwrite existing files. Defaults to False.
+        verbose (bool, optional): Whether to print the progress. Defaults to True.
+
+    Returns:
+        None
+
+    Remarks:
+        - the scanner extension is installed by duckdb on first use, so this needs internet access once
+        - mssql has no duckdb scanner, use `load_sql_to_sqlite()` and `load_sqlite_to_parquet()` instead
+    """
+
+    if not os.path.exists(dir_local):
+        os.makedirs(dir_local)
+
+    existing = set(os.listdir(dir_local))
+
+    # * source is only read, rows go from the scanner straight into the parquet writer
+    con = ddb.connect()
+    source_sql = source.replace("'", "''")
+    con.execute(f"ATTACH '{source_sql}' AS src (TYPE {dbms}, READ_ONLY)")
+    con.execute("SET preserve_insertion_order=false")
+
+    for table_sql, table_friendly in _split_tables(list_tables):
+        path = os.path.join(dir_local, f"{table_friendly}.parquet")
+        exists = f"{table_friendly}.parquet" in existing
+
+        if exists and not overwrite:
+            if verbose:
+                print(f"💨 skipping: {path}")
+            continue
+
+        if verbose:
+            print(f"⏳ {'replacing' if exists else 'creating'}: {table_sql} -> {path}")
+
+        limit = f" limit {top_n_rows}" if top_n_rows else ""
+        con.execute(
+            f"copy (select * from src.{table_sql}{limit}) to '{path}' "
+            "(format parquet, compression zstd, row_group_size 122880)"
+        )
 
     con.close()
     return
@@ -235,6 +542,7 @@ def unpack_files_to_duckdb(
     prefix: str = "",
     verbose: bool = False,
     debug: bool = False,
+    union: bool = False,
 ):
     """
     Unpack files from a given directory to a DuckDB database (['csv', 'parquet']).
@@ -243,21 +551,32 @@ def unpack_files_to_duckdb(
     Args:
         dir (Path): The directory containing the files to unpack.
         ext (Literal["csv", "parquet"]): The file extension to unpack.
-        con (duckdb connection, optional): The DuckDB connection to use. Defaults to None.
+        con (duckdb connection, optional): The DuckDB connection to use. Defaults to None, which creates a connection that stays open with the returned relations.
         list_files (list[str], optional): A list of files to unpack. Defaults to None.
         prefix (str, optional): A prefix to add to the unpacked files. Defaults to "".
         verbose (bool, optional): Whether to print loading messages. Defaults to False.
         debug (bool, optional): Whether to return a string instead of a DuckDB database. Defaults to False.
+        union (bool, optional): Whether to read all files in one parallel scan into a single relation, with a `filename` column to tell them apart. Defaults to False.
 
     Returns:
-        Union[Tuple, str]: If debug is False, returns a tuple of DuckDB tables. If debug is True, returns a string of sorted file names.
+        Union[Tuple, str]: If debug is False, returns a tuple of DuckDB tables (a single relation if union is True). If no file matches, returns an empty tuple in both modes. If debug is True, returns a string of sorted file names.
 
     """
     # * if no con given, create new
     con_ = con if con else ddb.connect()
+    # * relations are scanned again on every query, keep the parquet footers in memory.
+    # * settings of a given con belong to the caller and stay untouched
+    if not con and ext == "parquet":
+        con_.execute("SET parquet_metadata_cache=true")
     
-    # * get basename of each file
-    files = set([os.path.basename(file).split(".")[0] for file in os.listdir(dir)])
+    # * get basename of each file with the requested extension
+    suffix = f".{ext}"
+    with os.scandir(dir) as entries:
+        files = {
+            entry.name[: -len(suffix)]
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        }
     
     # * filter files if present
     if list_files is not None:
@@ -268,6 +587,28 @@ def unpack_files_to_duckdb(
         return None
     else: files=sorted(files)
 
+    # * one multi-file scan instead of a relation per file
+    if union and not debug:
+        # * nothing to scan, return an empty tuple like the per file mode does
+        if not files:
+            if not con:
+                con_.close()
+            return ()
+        if verbose:
+            print(f"⏳ loading {len(files)} files")
+        # * without a file filter duckdb expands the glob itself
+        if list_files is None:
+            paths = (dir / f"*.{ext}").as_posix()
+        else:
+            paths = [(dir / f"{file}.{ext}").as_posix() for file in files]
+        if ext == "parquet":
+            out = con_.read_parquet(paths, filename=True, union_by_name=True)
+        elif ext == "csv":
+            out = con_.read_csv(paths, header=True, filename=True, union_by_name=True)
+
+        # * relation is evaluated lazily and needs its connection, so a connection created here stays open
+        return out
+
     items = []
     for file in files:
         if verbose or debug:
@@ -290,8 +631,8 @@ def unpack_files_to_duckdb(
         files = [f"{prefix}{file}" for file in files]
         out = str(sorted(files)).replace("'", "").replace("[", "").replace("]", "")
 
-    # * if existing con was given, dont close
-    if not con:
+    # * relations need their connection when evaluated, so only a debug run closes a connection created here
+    if not con and debug:
         con_.close()
 
     return out
\ No newline at end of file